@@ -66,9 +66,9 @@ def cmd_run(skt_data):
 
         skt_data.state.jobs = ' '.join(runner.job_to_recipe_set_map.keys())
         skt_data.state.recipesets = ' '.join(
-            list(itertools.chain.from_iterable(
+            itertools.chain.from_iterable(
                 runner.job_to_recipe_set_map.values()
-            ))
+            )
         )
 
         skt_data.state.retcode = runner.retcode
@@ -31,6 +31,15 @@ from skt.misc import SKT_SUCCESS, SKT_FAIL, SKT_ERROR, SKT_BOOT
 from skt.misc import is_task_waived
 from cki_lib.misc import safe_popen, retry_safe_popen
 
+# Transient errors of "bkr job-results" and "bkr job-submit" that are retried
+RESULTS_RETRY_ERRORS = ["ProtocolError", "503 Service Unavailable"]
+SUBMIT_RETRY_ERRORS = ["connection to beaker.engineering.redhat.com failed",
+                       "Can't connect to MySQL server on"]
+# Recipe statuses that won't change anymore
+FINISHED_RECIPE_STATUSES = frozenset(['Completed', 'Aborted', 'Cancelled'])
+# "bkr job-submit" output line with the ID of the submitted job
+SUBMITTED_JOB_RE = re.compile(r"^Submitted: \['([^']+)'\]$", re.MULTILINE)
+
 
 class ConditionCheck:
     def __init__(self, retval, **kwargs):
@@ -185,8 +194,8 @@ class BeakerRunner:
         """
         args = ["bkr", "job-results", "--prettyxml", taskspec]
 
-        err_strings = ["ProtocolError", "503 Service Unavailable"]
-        stdout, stderr, returncode = retry_safe_popen(err_strings, args,
+        stdout, stderr, returncode = retry_safe_popen(RESULTS_RETRY_ERRORS,
+                                                      args,
                                                       stderr=subprocess.PIPE,
                                                       stdout=subprocess.PIPE)
 
@@ -304,7 +313,8 @@ class BeakerRunner:
             logging.error('All test sets aborted or were cancelled!')
             return SKT_ERROR
 
-        rcpid_and_results = []
+        # first recipe (in submission order) that hit each return code
+        first_rcpid_by_result = {}
         for _, recipe_sets in self.job_to_recipe_set_map.items():
             for recipe_set_id in recipe_sets:
                 results = self.recipe_set_results[recipe_set_id]
@@ -316,14 +326,13 @@ class BeakerRunner:
                     # log output of decide_run_result_by_task for final rc only
                     logging.info(msg)
 
-                    rcpid_and_results.append((rcpid, ret))
+                    first_rcpid_by_result.setdefault(ret, rcpid)
 
         for ret in [SKT_ERROR, SKT_BOOT, SKT_FAIL]:
-            for rcpid, result in rcpid_and_results:
-                if ret == result:
-                    logging.info(f'Failure ({ret}) in recipeid {rcpid}'
-                                 f' detected!')
-                    return ret
+            if ret in first_rcpid_by_result:
+                logging.info('Failure (%s) in recipeid %s detected!',
+                             ret, first_rcpid_by_result[ret])
+                return ret
 
         logging.info('Testing passed!')
         return SKT_SUCCESS
@@ -490,20 +499,20 @@ class BeakerRunner:
             for recipe_set_id in self.watchlist.copy():
                 root = self.getresultstree(recipe_set_id)
                 recipes = root.findall('.//recipe')
+                completed = self.completed_recipes[recipe_set_id]
 
                 for recipe in recipes:
                     result = recipe.attrib.get('result')
                     status = recipe.attrib.get('status')
                     recipe_id = 'R:' + recipe.attrib.get('id')
-                    if status not in ['Completed', 'Aborted', 'Cancelled'] or \
-                            recipe_id in self.completed_recipes[recipe_set_id]:
+                    if status not in FINISHED_RECIPE_STATUSES or \
+                            recipe_id in completed:
                         # continue watching unfinished recipes
                         continue
 
                     logging.info("%s status changed to %s", recipe_id, status)
-                    self.completed_recipes[recipe_set_id].add(recipe_id)
-                    if len(self.completed_recipes[recipe_set_id]) == \
-                            len(recipes):
+                    completed.add(recipe_id)
+                    if len(completed) == len(recipes):
                         try:
                             self.watchlist.remove(recipe_set_id)
                         except KeyError:
@@ -622,29 +631,23 @@ class BeakerRunner:
 
     def __jobsubmit(self, xml):
         # pylint: disable=no-self-use
-        jobid = None
         args = ["bkr", "job-submit"]
 
         if self.jobowner is not None:
             args += ["--job-owner=%s" % self.jobowner]
 
         args += ["-"]
-        err_strings = ["connection to beaker.engineering.redhat.com failed",
-                       "Can't connect to MySQL server on"]
-        stdout, stderr, retcode = retry_safe_popen(err_strings, args,
+        stdout, stderr, retcode = retry_safe_popen(SUBMIT_RETRY_ERRORS, args,
                                                    stdin_data=xml,
                                                    stdin=subprocess.PIPE,
                                                    stderr=subprocess.PIPE,
                                                    stdout=subprocess.PIPE)
 
-        for line in stdout.split("\n"):
-            match = re.match(r"^Submitted: \['([^']+)'\]$", line)
-            if match:
-                jobid = match.group(1)
-                break
+        match = SUBMITTED_JOB_RE.search(stdout)
+        jobid = match.group(1) if match else None
 
         if not jobid:
-            logging.info(f'retcode={retcode}, stderr={stderr}')
+            logging.info('retcode=%s, stderr=%s', retcode, stderr)
             logging.info(stdout)
             raise Exception('Unable to submit the job!')
 